@@ -501,6 +501,31 @@ class Stack:
         index = self._slices.index(slice)
         self._slices[index] = None
 
+    ##
+    # Delete all slices of given slice numbers in a single pass
+    # \date       2026-08-29 14:02:31+0200
+    #
+    # Note that slice numbers refer to the actual slice numbers within the
+    # original stack, cf. delete_slice. Bookkeeping is updated once instead
+    # of per deleted slice.
+    #
+    # \param      self           The object
+    # \param      slice_numbers  slice numbers as iterable of integers
+    #
+    def delete_slices(self, slice_numbers):
+        slice_numbers = set(int(j) for j in slice_numbers)
+
+        # keep slice numbers (w.r.t. original stack)
+        self._deleted_slices = sorted(
+            self._deleted_slices + list(slice_numbers))
+
+        # delete slices in one sweep over the slice list
+        self._slices = [
+            None if s is not None and
+            s.get_slice_number() in slice_numbers
+            else s
+            for s in self._slices]
+
     def get_deleted_slice_numbers(self):
         return list(self._deleted_slices)
 
@@ -8,6 +8,8 @@
 
 import os
 import scipy
+import hashlib
+import concurrent.futures
 import numpy as np
 import SimpleITK as sitk
 import matplotlib.pyplot as plt
@@ -16,6 +18,33 @@ import pysitk.python_helper as ph
 import pysitk.simple_itk_helper as sitkh
 import niftymic.validation.residual_evaluator as re
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    ##
+    # Fused gather-and-compare kernel: flag the slices whose similarity
+    # value falls below the threshold. NaN-safe (NaN never rejects).
+    #
+    @numba.njit(cache=True)
+    def _reject(nda_sim, slice_nums, threshold):
+        n = slice_nums.shape[0]
+        out = np.empty(n, np.bool_)
+        for k in range(n):
+            v = nda_sim[slice_nums[k]]
+            out[k] = (v == v) and (v < threshold)
+        return out
+
+    # Warm the JIT cache at import time so that the first stack does not
+    # pay the compilation cost
+    _reject(np.zeros(1), np.zeros(1, np.int64), 0.)
+else:
+    def _reject(nda_sim, slice_nums, threshold):
+        v = nda_sim[slice_nums]
+        return (v == v) & (v < threshold)
+
 
 ##
 # Class to identify and reject outliers
@@ -23,6 +52,12 @@ import niftymic.validation.residual_evaluator as re
 #
 class OutlierRejector(object):
 
+    # Most recent slice similarity evaluation, shared across instances
+    # since the rejector is typically re-created per reconstruction cycle;
+    # keyed conservatively by reference content and slice motion state so
+    # that any update in between misses (cf. _get_similarity_cache_key)
+    _similarity_cache = {}
+
     def __init__(self,
                  stacks,
                  reference,
@@ -31,6 +66,7 @@ class OutlierRejector(object):
                  use_reference_mask=True,
                  measure="NCC",
                  verbose=True,
+                 num_threads=1,
                  ):
 
         self._stacks = stacks
@@ -40,54 +76,126 @@ class OutlierRejector(object):
         self._use_slice_masks = use_slice_masks
         self._use_reference_mask = use_reference_mask
         self._verbose = verbose
+        self._num_threads = int(num_threads)
 
     def get_stacks(self):
         return self._stacks
 
+    ##
+    # Build the cache key identifying the inputs of the slice similarity
+    # evaluation: the reference image (and mask, where used), the
+    # similarity configuration and the current position of every slice.
+    # \date       2026-08-29 15:24:18+0200
+    #
+    # \param      self  The object
+    #
+    # \return     Hashable cache key
+    #
+    def _get_similarity_cache_key(self):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(sitk.GetArrayViewFromImage(self._reference.sitk).tobytes())
+        if self._use_reference_mask:
+            h.update(sitk.GetArrayViewFromImage(
+                self._reference.sitk_mask).tobytes())
+        for stack in self._stacks:
+            h.update(stack.get_filename().encode())
+            for slice in stack.get_slices():
+                transform = slice.get_affine_transform()
+                h.update(np.array(
+                    (float(slice.get_slice_number()),)
+                    + transform.GetParameters()
+                    + transform.GetFixedParameters()).tobytes())
+
+        return (h.hexdigest(),
+                self._measure,
+                bool(self._use_slice_masks),
+                bool(self._use_reference_mask))
+
     def run(self):
-        residual_evaluator = re.ResidualEvaluator(
-            stacks=self._stacks,
-            reference=self._reference,
-            use_slice_masks=self._use_slice_masks,
-            use_reference_mask=self._use_reference_mask,
-            verbose=False,
-            measures=[self._measure],
-        )
-        residual_evaluator.compute_slice_projections()
-        residual_evaluator.evaluate_slice_similarities()
-        slice_sim = residual_evaluator.get_slice_similarities()
+        cache_key = self._get_similarity_cache_key()
+        slice_sim = OutlierRejector._similarity_cache.get(cache_key)
+
+        if slice_sim is None:
+            residual_evaluator = re.ResidualEvaluator(
+                stacks=self._stacks,
+                reference=self._reference,
+                use_slice_masks=self._use_slice_masks,
+                use_reference_mask=self._use_reference_mask,
+                verbose=False,
+                measures=[self._measure],
+            )
+            residual_evaluator.compute_slice_projections()
+            residual_evaluator.evaluate_slice_similarities()
+            slice_sim = residual_evaluator.get_slice_similarities()
+
+            # Only the latest evaluation is kept; earlier cycles operate on
+            # an outdated reference/motion state and cannot hit again
+            OutlierRejector._similarity_cache = {cache_key: slice_sim}
         # residual_evaluator.show_slice_similarities(
         #     threshold=self._threshold,
         #     measures=[self._measure],
         #     directory="/tmp/spina/figs%s" % self._print_prefix[0:7],
         # )
 
-        remove_stacks = []
-        for i, stack in enumerate(self._stacks):
-            nda_sim = np.nan_to_num(
-                slice_sim[stack.get_filename()][self._measure])
-            indices = np.where(nda_sim < self._threshold)[0]
+        ##
+        # Per-stack similarity thresholding; free of side effects, hence
+        # stacks can be evaluated concurrently (numpy and the numba kernel
+        # release the GIL)
+        def _evaluate_stack(stack):
+            filename = stack.get_filename()
+            # In-place NaN-to-zero normalization; this deliberately also
+            # rewrites arrays held in _similarity_cache (idempotent, and
+            # NaN is treated as zero on every path consuming them)
+            nda_sim = slice_sim[filename][self._measure]
+            np.nan_to_num(nda_sim, copy=False)
             slices = stack.get_slices()
 
             # only those indices that match the available slice numbers
-            rejections = [
-                j for j in [s.get_slice_number() for s in slices]
-                if j in indices
-            ]
+            slice_nums = np.fromiter(
+                (s.get_slice_number() for s in slices),
+                dtype=np.int64,
+                count=len(slices))
+            reject_mask = _reject(nda_sim, slice_nums, self._threshold)
+
+            return filename, nda_sim, slices, slice_nums[reject_mask]
+
+        if self._num_threads > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._num_threads) as executor:
+                results = list(executor.map(_evaluate_stack, self._stacks))
+        else:
+            results = [_evaluate_stack(stack) for stack in self._stacks]
+
+        # Slice deletions and reporting are applied serially, in stack
+        # order, on the main thread
+        remove_stacks = []
+        n_stacks = len(self._stacks)
+        for i, (stack, result) in enumerate(zip(self._stacks, results)):
+            filename, nda_sim, slices, rejections = result
+
+            # Fast path: nothing to reject and nothing to report for this
+            # stack (the common case for good stacks)
+            if len(rejections) == 0 and not self._verbose:
+                if len(slices) == 0:
+                    remove_stacks.append(stack)
+                continue
+
+            rejections_list = rejections.tolist()
+            rejections_set = set(rejections_list)
 
-            for slice in slices:
-                if slice.get_slice_number() in rejections:
-                    stack.delete_slice(slice)
+            if len(rejections_set) > 0:
+                stack.delete_slices(rejections_set)
 
             if self._verbose:
+                deleted_slice_numbers = stack.get_deleted_slice_numbers()
                 txt = "Stack %d/%d (%s): Slice rejections %d/%d [%s]" % (
                     i + 1,
-                    len(self._stacks),
-                    stack.get_filename(),
-                    len(stack.get_deleted_slice_numbers()),
+                    n_stacks,
+                    filename,
+                    len(deleted_slice_numbers),
                     stack.sitk.GetSize()[-1],
                     ph.convert_numbers_to_hyphenated_ranges(
-                        stack.get_deleted_slice_numbers()),
+                        deleted_slice_numbers),
                 )
                 if len(rejections) > 0:
                     res_values = nda_sim[rejections]
@@ -95,7 +203,7 @@ class OutlierRejector(object):
                         "%d [%s] (%s < %g): %s" % (
                             len(rejections),
                             ph.convert_numbers_to_hyphenated_ranges(
-                                rejections),
+                                rejections_list),
                             self._measure,
                             self._threshold,
                             np.round(res_values, 2).tolist(),